@@ -0,0 +1,36 @@
+"""set custom job run step fillfactor
+
+Lowers custom_job_run_step's fillfactor to 70. Each step row is updated as it
+moves through pending, started and finished, and none of those updates touch
+an indexed column, so leaving free space on the page lets them be heap-only
+(HOT) updates that skip every index.
+
+custom_job_run and custom_job_trigger_event keep the default: every update to
+them changes status, which is in their partial index predicates, so their
+updates can never be HOT and the reserved space would only bloat the heap.
+
+Only affects pages written after the change; existing pages fill up as before
+until the table is rewritten.
+
+Revision ID: 0d2f4b6a8c1e
+Revises: 2b4d6f8a0c1e
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0d2f4b6a8c1e"
+down_revision = "2b4d6f8a0c1e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE custom_job_run_step SET (fillfactor = 70)")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE custom_job_run_step RESET (fillfactor)")
@@ -0,0 +1,36 @@
+"""drop redundant custom job run step index
+
+ix_custom_job_run_step_run indexed (run_id, step_index), the same key as the
+btree backing uq_custom_job_run_step_index. Every step insert paid for both
+and the planner only ever needs one; the unique index serves the per-run
+step listing on its own.
+
+Idempotent: databases that ran the current e1f2a3b4c5d6 never had the index,
+hence IF EXISTS (op.drop_index has no if_exists in the pinned alembic).
+
+Revision ID: 1e3a5c7b9d2f
+Revises: 0d2f4b6a8c1e
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "1e3a5c7b9d2f"
+down_revision = "0d2f4b6a8c1e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_custom_job_run_step_run")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_custom_job_run_step_run",
+        "custom_job_run_step",
+        ["run_id", "step_index"],
+    )
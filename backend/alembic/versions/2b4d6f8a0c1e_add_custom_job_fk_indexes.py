@@ -0,0 +1,48 @@
+"""add custom job fk indexes
+
+Adds partial indexes covering custom_job_run.trigger_event_id and
+custom_job_audit_log.user_id. Both foreign keys are ON DELETE SET NULL, so
+without an index every trigger event removed by retention cleanup, and every
+user deletion, scans the whole run or audit log table.
+
+Idempotent: databases that ran the current e1f2a3b4c5d6 already have these
+indexes; they are rebuilt in place.
+
+Revision ID: 2b4d6f8a0c1e
+Revises: 6a8c0e2f4b5d
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "2b4d6f8a0c1e"
+down_revision = "6a8c0e2f4b5d"
+branch_labels = None
+depends_on = None
+
+
+# index name -> (table, foreign key column)
+CUSTOM_JOB_FK_INDEXES: dict[str, tuple[str, str]] = {
+    "ix_custom_job_run_trigger_event_id": ("custom_job_run", "trigger_event_id"),
+    "ix_custom_job_audit_log_user_id": ("custom_job_audit_log", "user_id"),
+}
+
+
+def upgrade() -> None:
+    for index_name, (table, column) in CUSTOM_JOB_FK_INDEXES.items():
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+        op.create_index(
+            index_name,
+            table,
+            [column],
+            postgresql_where=sa.text(f"{column} IS NOT NULL"),
+        )
+
+
+def downgrade() -> None:
+    for index_name in CUSTOM_JOB_FK_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
@@ -0,0 +1,100 @@
+"""maintain crm search_tsv with triggers
+
+Converts the STORED generated search_tsv columns on crm_contact,
+crm_organization and crm_interaction into plain columns kept up to date by
+BEFORE INSERT / UPDATE OF <source columns> triggers, so updates that don't
+touch searchable text no longer recompute the tsvector.
+
+Idempotent: databases created by the current squashed CRM migration already
+have the triggers and plain columns; this only converts older schemas.
+
+Revision ID: 3d5f7a9c1e2b
+Revises: 9c2e4a6b8d0f
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "3d5f7a9c1e2b"
+down_revision = "9c2e4a6b8d0f"
+branch_labels = None
+depends_on = None
+
+
+# table -> (searchable source columns, weighted tsvector over the NEW row)
+CRM_SEARCH_TSV_SOURCES: dict[str, tuple[list[str], str]] = {
+    "crm_contact": (
+        ["first_name", "last_name", "email", "title", "notes"],
+        """
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.first_name, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.last_name, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.email, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.title, '')), 'C') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.notes, '')), 'D')
+        """,
+    ),
+    "crm_organization": (
+        ["name", "website", "sector", "notes"],
+        """
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.website, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.sector, '')), 'C') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.notes, '')), 'D')
+        """,
+    ),
+    "crm_interaction": (
+        ["title", "summary"],
+        """
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.summary, '')), 'B')
+        """,
+    ),
+}
+
+
+def upgrade() -> None:
+    for table, (columns, expression) in CRM_SEARCH_TSV_SOURCES.items():
+        # Keeps the already-computed values; no table rewrite
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN search_tsv DROP EXPRESSION IF EXISTS"
+        )
+        op.execute(
+            f"""
+            CREATE OR REPLACE FUNCTION {table}_search_tsv_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_tsv := {expression};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+            """
+        )
+        source_columns = ", ".join(columns)
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_search_tsv_trigger ON {table}")
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_search_tsv_trigger
+            BEFORE INSERT OR UPDATE OF {source_columns} ON {table}
+            FOR EACH ROW EXECUTE FUNCTION {table}_search_tsv_update()
+            """
+        )
+
+
+def downgrade() -> None:
+    for table, (_, expression) in CRM_SEARCH_TSV_SOURCES.items():
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_search_tsv_trigger ON {table}")
+        op.execute(f"DROP FUNCTION IF EXISTS {table}_search_tsv_update()")
+
+        generated_expression = expression.replace("NEW.", "")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_tsv")
+        op.execute(
+            f"""
+            ALTER TABLE {table}
+            ADD COLUMN search_tsv tsvector GENERATED ALWAYS AS ({generated_expression}) STORED
+            """
+        )
+        op.execute(
+            f"CREATE INDEX ix_{table}_search_tsv ON {table} USING GIN (search_tsv)"
+        )
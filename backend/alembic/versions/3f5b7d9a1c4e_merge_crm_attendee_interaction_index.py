@@ -0,0 +1,57 @@
+"""merge crm attendee interaction index
+
+crm_interaction_attendee had a plain index on interaction_id next to two
+partial unique indexes led by interaction_id. The partial indexes cannot
+serve a bare interaction_id lookup, so every insert maintained the plain
+index as well.
+
+uq_crm_interaction_attendee_user is rebuilt without its user_id IS NOT NULL
+predicate. It enforces the same rule, because NULL user_ids never conflict in
+a unique index. As a full index it also serves the attendee listing and the
+cascade from crm_interaction, so ix_crm_interaction_attendee_interaction_id
+is dropped.
+
+Idempotent: databases created by the current squashed CRM migration already
+have the final layout; the unique index is rebuilt in place there.
+
+Revision ID: 3f5b7d9a1c4e
+Revises: 1e3a5c7b9d2f
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "3f5b7d9a1c4e"
+down_revision = "1e3a5c7b9d2f"
+branch_labels = None
+depends_on = None
+
+
+USER_INDEX = "uq_crm_interaction_attendee_user"
+
+
+def upgrade() -> None:
+    op.execute(f"DROP INDEX IF EXISTS {USER_INDEX}")
+    op.create_index(
+        USER_INDEX,
+        "crm_interaction_attendee",
+        ["interaction_id", "user_id"],
+        unique=True,
+    )
+    op.execute("DROP INDEX IF EXISTS ix_crm_interaction_attendee_interaction_id")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_crm_interaction_attendee_interaction_id "
+        "ON crm_interaction_attendee (interaction_id)"
+    )
+    op.execute(f"DROP INDEX IF EXISTS {USER_INDEX}")
+    op.execute(
+        f"CREATE UNIQUE INDEX {USER_INDEX} "
+        "ON crm_interaction_attendee (interaction_id, user_id) "
+        "WHERE user_id IS NOT NULL"
+    )
@@ -0,0 +1,41 @@
+"""use external storage for encrypted columns
+
+oauth_account.access_token, oauth_account.refresh_token and
+llm_provider.custom_config hold ciphertext since a1d4f89ce352. Ciphertext is
+incompressible, so EXTERNAL storage keeps large values out-of-line in TOAST
+without the LZ compression attempt EXTENDED storage makes on every write.
+
+Only the column's storage mode changes; existing values are not rewritten and
+pick up the new mode the next time they are updated.
+
+Revision ID: 4a6c8e0b2d5f
+Revises: 3f5b7d9a1c4e
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "4a6c8e0b2d5f"
+down_revision = "3f5b7d9a1c4e"
+branch_labels = None
+depends_on = None
+
+
+ENCRYPTED_COLUMNS: list[tuple[str, str]] = [
+    ("oauth_account", "access_token"),
+    ("oauth_account", "refresh_token"),
+    ("llm_provider", "custom_config"),
+]
+
+
+def upgrade() -> None:
+    for table, column in ENCRYPTED_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    for table, column in ENCRYPTED_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTENDED")
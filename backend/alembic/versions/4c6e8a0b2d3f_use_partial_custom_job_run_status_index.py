@@ -0,0 +1,44 @@
+"""use partial custom_job_run status index
+
+Replaces the full-table ix_custom_job_run_status btree with
+ix_custom_job_run_active, a partial (custom_job_id, status) index over pending
+and started runs only. Those are the only statuses queried across runs, and
+terminal runs make up nearly all of the table, so the index stays small and
+terminal inserts no longer maintain it.
+
+Idempotent: databases that ran the current e1f2a3b4c5d6 already have the
+partial index; it is rebuilt in place, which is cheap on those new tables.
+
+Revision ID: 4c6e8a0b2d3f
+Revises: 8f2a4c6e0b1d
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "4c6e8a0b2d3f"
+down_revision = "8f2a4c6e0b1d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_custom_job_run_active")
+    op.create_index(
+        "ix_custom_job_run_active",
+        "custom_job_run",
+        ["custom_job_id", "status"],
+        postgresql_where=sa.text("status IN ('PENDING', 'STARTED')"),
+    )
+    op.execute("DROP INDEX IF EXISTS ix_custom_job_run_status")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_custom_job_run_status ON custom_job_run (status)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_custom_job_run_active")
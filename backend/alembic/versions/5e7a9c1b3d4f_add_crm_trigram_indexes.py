@@ -0,0 +1,50 @@
+"""add crm trigram indexes
+
+Adds pg_trgm GIN indexes backing the ILIKE '%query%' substring lookups on
+contact names/emails, organization names and tag names, which a plain btree
+or the stemmed search_tsv cannot serve.
+
+Idempotent: databases created by the current squashed CRM migration already
+have these indexes.
+
+Revision ID: 5e7a9c1b3d4f
+Revises: 3d5f7a9c1e2b
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+
+from alembic import op
+
+from shared_configs.configs import POSTGRES_DEFAULT_SCHEMA
+
+
+# revision identifiers, used by Alembic.
+revision = "5e7a9c1b3d4f"
+down_revision = "3d5f7a9c1e2b"
+branch_labels = None
+depends_on = None
+
+
+# index name -> (table, expression)
+CRM_TRGM_INDEXES: dict[str, tuple[str, str]] = {
+    "ix_crm_contact_name_trgm": (
+        "crm_contact",
+        "(first_name || ' ' || coalesce(last_name, ''))",
+    ),
+    "ix_crm_contact_email_trgm": ("crm_contact", "email"),
+    "ix_crm_organization_name_trgm": ("crm_organization", "name"),
+    "ix_crm_tag_name_trgm": ("crm_tag", "name"),
+}
+
+
+def upgrade() -> None:
+    for index_name, (table, expression) in CRM_TRGM_INDEXES.items():
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} "
+            f"USING GIN ({expression} {POSTGRES_DEFAULT_SCHEMA}.gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    for index_name in CRM_TRGM_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
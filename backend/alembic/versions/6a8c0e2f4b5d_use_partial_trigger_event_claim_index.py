@@ -0,0 +1,55 @@
+"""use partial trigger event claim index
+
+Replaces ix_custom_job_trigger_event_claim (custom_job_id, status, event_time)
+and ix_custom_job_trigger_event_status (status) with
+ix_custom_job_trigger_event_received, a partial index over RECEIVED events in
+claim order. The claim scan reads RECEIVED events across all jobs ordered by
+event_time, which the old per-job composite could not serve, and terminal
+events no longer bloat either index.
+
+Idempotent: databases that ran the current e1f2a3b4c5d6 already have the
+partial index; it is rebuilt in place, which is cheap on those new tables.
+
+Revision ID: 6a8c0e2f4b5d
+Revises: 4c6e8a0b2d3f
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "6a8c0e2f4b5d"
+down_revision = "4c6e8a0b2d3f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_custom_job_trigger_event_received")
+    op.create_index(
+        "ix_custom_job_trigger_event_received",
+        "custom_job_trigger_event",
+        [sa.column("event_time").asc().nulls_first()],
+        postgresql_where=sa.text("status = 'RECEIVED'"),
+    )
+    op.execute("DROP INDEX IF EXISTS ix_custom_job_trigger_event_claim")
+    op.execute("DROP INDEX IF EXISTS ix_custom_job_trigger_event_status")
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_custom_job_trigger_event_claim
+            ON custom_job_trigger_event (custom_job_id, status, event_time)
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_custom_job_trigger_event_status
+            ON custom_job_trigger_event (status)
+        """
+    )
+    op.execute("DROP INDEX IF EXISTS ix_custom_job_trigger_event_received")
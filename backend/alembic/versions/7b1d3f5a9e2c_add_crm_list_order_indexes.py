@@ -0,0 +1,70 @@
+"""add crm list order indexes
+
+Replaces the single-column CRM contact/interaction lookup indexes with
+composite indexes whose trailing key matches the ORDER BY of the list views,
+so filtered, paginated listings read the first page straight off the index
+instead of sorting every matching row. The leading column still serves the
+foreign-key lookups the old indexes existed for.
+
+Idempotent: databases created by the current squashed CRM migration already
+have the new indexes.
+
+Revision ID: 7b1d3f5a9e2c
+Revises: 5e7a9c1b3d4f
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "7b1d3f5a9e2c"
+down_revision = "5e7a9c1b3d4f"
+branch_labels = None
+depends_on = None
+
+
+# new index name -> (table, columns, replaced index name, replaced index column)
+CRM_LIST_ORDER_INDEXES: dict[str, tuple[str, str, str, str]] = {
+    "ix_crm_contact_organization_updated_at": (
+        "crm_contact",
+        "organization_id, updated_at DESC",
+        "ix_crm_contact_organization_id",
+        "organization_id",
+    ),
+    "ix_crm_contact_status_updated_at": (
+        "crm_contact",
+        "status, updated_at DESC",
+        "ix_crm_contact_status",
+        "status",
+    ),
+    "ix_crm_interaction_contact_time": (
+        "crm_interaction",
+        "contact_id, coalesce(occurred_at, created_at) DESC",
+        "ix_crm_interaction_contact_id",
+        "contact_id",
+    ),
+    "ix_crm_interaction_org_time": (
+        "crm_interaction",
+        "organization_id, coalesce(occurred_at, created_at) DESC",
+        "ix_crm_interaction_organization_id",
+        "organization_id",
+    ),
+}
+
+
+def upgrade() -> None:
+    for index_name, spec in CRM_LIST_ORDER_INDEXES.items():
+        table, columns, replaced_name, _ = spec
+        op.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({columns})")
+        op.execute(f"DROP INDEX IF EXISTS {replaced_name}")
+
+
+def downgrade() -> None:
+    for index_name, spec in CRM_LIST_ORDER_INDEXES.items():
+        table, _, replaced_name, replaced_column = spec
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {replaced_name} ON {table} ({replaced_column})"
+        )
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
@@ -0,0 +1,37 @@
+"""use brin for chat_message time_sent
+
+Replaces the btree ix_chat_message_time_sent created by e1f2a3b4c5d6 with a
+BRIN index. time_sent is append-ordered and only queried by time window, so
+BRIN serves the same range scans at a tiny fraction of the btree's size and
+write cost.
+
+Revision ID: 8f2a4c6e0b1d
+Revises: 7b1d3f5a9e2c
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "8f2a4c6e0b1d"
+down_revision = "7b1d3f5a9e2c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_chat_message_time_sent")
+    op.create_index(
+        "ix_chat_message_time_sent",
+        "chat_message",
+        ["time_sent"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_chat_message_time_sent")
+    op.create_index("ix_chat_message_time_sent", "chat_message", ["time_sent"])
@@ -0,0 +1,34 @@
+"""add unique index on tool.in_code_tool_id
+
+Tool seed migrations upsert with ON CONFLICT (in_code_tool_id), which needs a
+unique index on the column. Fresh databases get it from e2f3a4b5c6d7; this
+backfills databases that were already past that revision, first merging any
+duplicate rows the old select-then-insert seeds left.
+
+Revision ID: 9c2e4a6b8d0f
+Revises: a1d4f89ce352
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from alembic import context
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "9c2e4a6b8d0f"
+down_revision = "a1d4f89ce352"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The merge-and-index helper lives in e2f3a4b5c6d7; it is a no-op once the
+    # index exists.
+    index_owner = context.script.get_revision("e2f3a4b5c6d7")
+    assert index_owner is not None
+    index_owner.module.ensure_in_code_tool_id_unique_index(op.get_bind())
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS uq_tool_in_code_tool_id;")
@@ -18,6 +18,8 @@ depends_on = None
 
 
 def upgrade() -> None:
+    # convert_to rather than a ::bytea cast: text::bytea parses backslash
+    # escapes, so any token containing a backslash would be mangled or rejected.
     op.alter_column(
         "oauth_account",
         "access_token",
@@ -34,6 +36,8 @@ def upgrade() -> None:
         existing_nullable=False,
         postgresql_using="convert_to(refresh_token, 'UTF8')",
     )
+    # Same reason for convert_to: serialized JSON escapes quotes and control
+    # characters with backslashes, which a ::bytea cast would reinterpret.
     op.alter_column(
         "llm_provider",
         "custom_config",
@@ -1,6 +1,9 @@
 """compat_placeholder_seed_crm_tools
 
 Compatibility placeholder for legacy revision ID b6c7d8e9f0a1.
+The tool seed now runs as a single multi-row upsert in e3f4a5b6c7d8 with
+the final descriptions; this file must remain so environments stamped
+with this ID can still resolve the revision chain.
 
 Revision ID: b6c7d8e9f0a1
 Revises: a9f1c2d3e4f5
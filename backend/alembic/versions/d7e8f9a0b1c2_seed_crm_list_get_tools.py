@@ -1,6 +1,9 @@
 """compat_placeholder_seed_crm_list_get_tools
 
 Compatibility placeholder for legacy revision ID d7e8f9a0b1c2.
+The tool seed now runs as a single multi-row upsert in e3f4a5b6c7d8 with
+the final descriptions; this file must remain so environments stamped
+with this ID can still resolve the revision chain.
 
 Revision ID: d7e8f9a0b1c2
 Revises: c4e5f6a7b8c9
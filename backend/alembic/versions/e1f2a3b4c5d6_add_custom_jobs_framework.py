@@ -160,6 +160,9 @@ def upgrade() -> None:
         sa.UniqueConstraint("run_id", "step_index", name="uq_custom_job_run_step_index"),
         sa.UniqueConstraint("run_id", "step_id", name="uq_custom_job_run_step_id"),
     )
+    # Step rows are rewritten on every status change without touching an indexed
+    # column; spare room on each page lets those updates stay heap-only (HOT).
+    op.execute("ALTER TABLE custom_job_run_step SET (fillfactor = 70)")
 
     op.create_table(
         "custom_job_audit_log",
@@ -213,37 +216,56 @@ def upgrade() -> None:
         "custom_job_run",
         ["custom_job_id", sa.text("created_at DESC")],
     )
-    op.create_index("ix_custom_job_run_status", "custom_job_run", ["status"])
+    # Only pending/started runs are ever looked up by status across jobs
+    # (concurrency caps, stale-run sweep); terminal runs are the bulk of the
+    # table and stay out of the index.
     op.create_index(
-        "ix_custom_job_run_step_run",
-        "custom_job_run_step",
-        ["run_id", "step_index"],
-    )
-    op.create_index(
-        "ix_custom_job_trigger_event_claim",
-        "custom_job_trigger_event",
-        ["custom_job_id", "status", "event_time"],
+        "ix_custom_job_run_active",
+        "custom_job_run",
+        ["custom_job_id", "status"],
+        postgresql_where=sa.text("status IN ('PENDING', 'STARTED')"),
     )
+    # Matches the claim scan: RECEIVED events across all jobs, oldest first.
+    # Consumed/dropped/failed events dominate the table and stay out of it.
     op.create_index(
-        "ix_custom_job_trigger_event_status",
+        "ix_custom_job_trigger_event_received",
         "custom_job_trigger_event",
-        ["status"],
+        [sa.column("event_time").asc().nulls_first()],
+        postgresql_where=sa.text("status = 'RECEIVED'"),
     )
     op.create_index(
         "ix_custom_job_audit_log_job_created",
         "custom_job_audit_log",
         ["custom_job_id", sa.text("created_at DESC")],
     )
+    # Cover the SET NULL foreign keys on the high-volume tables so deleting a
+    # trigger event or a user does not scan every run / audit entry
+    op.create_index(
+        "ix_custom_job_run_trigger_event_id",
+        "custom_job_run",
+        ["trigger_event_id"],
+        postgresql_where=sa.text("trigger_event_id IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_custom_job_audit_log_user_id",
+        "custom_job_audit_log",
+        ["user_id"],
+        postgresql_where=sa.text("user_id IS NOT NULL"),
+    )
+
     op.create_index("ix_chat_message_time_sent", "chat_message", ["time_sent"])
 
 
 def downgrade() -> None:
     op.drop_index("ix_chat_message_time_sent", table_name="chat_message")
+    # 2b4d6f8a0c1e's downgrade may already have dropped these
+    op.execute("DROP INDEX IF EXISTS ix_custom_job_audit_log_user_id")
+    op.execute("DROP INDEX IF EXISTS ix_custom_job_run_trigger_event_id")
     op.drop_index("ix_custom_job_audit_log_job_created", table_name="custom_job_audit_log")
-    op.drop_index("ix_custom_job_trigger_event_status", table_name="custom_job_trigger_event")
-    op.drop_index("ix_custom_job_trigger_event_claim", table_name="custom_job_trigger_event")
-    op.drop_index("ix_custom_job_run_step_run", table_name="custom_job_run_step")
-    op.drop_index("ix_custom_job_run_status", table_name="custom_job_run")
+    # 6a8c0e2f4b5d's downgrade may already have dropped it
+    op.execute("DROP INDEX IF EXISTS ix_custom_job_trigger_event_received")
+    # 4c6e8a0b2d3f's downgrade may already have dropped it
+    op.execute("DROP INDEX IF EXISTS ix_custom_job_run_active")
     op.drop_index("ix_custom_job_run_job_created", table_name="custom_job_run")
     op.drop_index("uq_custom_job_run_idempotency", table_name="custom_job_run")
     op.drop_index("uq_custom_job_run_trigger_event", table_name="custom_job_run")
@@ -30,77 +30,116 @@ TOOL = {
 }
 
 
-def upgrade() -> None:
-    conn = op.get_bind()
+def ensure_in_code_tool_id_unique_index(conn: sa.engine.Connection) -> None:
+    """Create uq_tool_in_code_tool_id, merging duplicate tools first.
 
-    existing = conn.execute(
-        sa.text("SELECT id FROM tool WHERE in_code_tool_id = :in_code_tool_id"),
-        {"in_code_tool_id": TOOL["in_code_tool_id"]},
-    ).fetchone()
-
-    if existing:
-        tool_id = existing[0]
-        conn.execute(
-            sa.text(
-                """
-                UPDATE tool
-                SET name = :name,
-                    display_name = :display_name,
-                    description = :description,
-                    enabled = :enabled
-                WHERE id = :tool_id
-                """
-            ),
-            {
-                **TOOL,
-                "tool_id": tool_id,
-            },
-        )
-    else:
-        tool_id = conn.execute(
-            sa.text(
-                """
-                INSERT INTO tool (name, display_name, description, in_code_tool_id, enabled)
-                VALUES (:name, :display_name, :description, :in_code_tool_id, :enabled)
-                RETURNING id
-                """
-            ),
-            TOOL,
-        ).scalar_one()
+    Older seeds did select-then-insert, which could leave several tool rows per
+    in_code_tool_id. The oldest row is kept and every reference to the others is
+    moved onto it before they are deleted. Later revisions that need the index
+    on databases which ran an older version of this revision call this too.
+    """
+    if conn.execute(sa.text("SELECT to_regclass('uq_tool_in_code_tool_id')")).scalar():
+        return
 
+    conn.execute(
+        sa.text(
+            """
+            CREATE TEMP TABLE duplicate_tool AS
+            SELECT id, keep_id FROM (
+                SELECT id, min(id) OVER (PARTITION BY in_code_tool_id) AS keep_id
+                FROM tool
+                WHERE in_code_tool_id IS NOT NULL
+            ) AS ranked
+            WHERE id <> keep_id
+            """
+        )
+    )
     conn.execute(
         sa.text(
             """
             INSERT INTO persona__tool (persona_id, tool_id)
-            VALUES (0, :tool_id)
-            ON CONFLICT DO NOTHING
+            SELECT persona__tool.persona_id, duplicate_tool.keep_id
+            FROM persona__tool
+            JOIN duplicate_tool ON duplicate_tool.id = persona__tool.tool_id
+            ON CONFLICT (persona_id, tool_id) DO NOTHING
             """
-        ),
-        {"tool_id": tool_id},
+        )
+    )
+    # tool_call.tool_id is deliberately not a foreign key, so repoint it by hand
+    conn.execute(
+        sa.text(
+            """
+            UPDATE tool_call
+            SET tool_id = duplicate_tool.keep_id
+            FROM duplicate_tool
+            WHERE tool_call.tool_id = duplicate_tool.id
+            """
+        )
     )
+    conn.execute(
+        sa.text(
+            """
+            UPDATE assistant__user_specific_config
+            SET disabled_tool_ids = ARRAY(
+                SELECT DISTINCT coalesce(duplicate_tool.keep_id, disabled.tool_id)
+                FROM unnest(disabled_tool_ids) AS disabled (tool_id)
+                LEFT JOIN duplicate_tool ON duplicate_tool.id = disabled.tool_id
+            )
+            WHERE disabled_tool_ids && ARRAY(SELECT id FROM duplicate_tool)
+            """
+        )
+    )
+    # persona__tool.tool_id is ON DELETE CASCADE, so the old links go too
+    conn.execute(
+        sa.text("DELETE FROM tool WHERE id IN (SELECT id FROM duplicate_tool)")
+    )
+    conn.execute(sa.text("DROP TABLE duplicate_tool"))
 
+    conn.execute(
+        sa.text(
+            """
+            CREATE UNIQUE INDEX uq_tool_in_code_tool_id
+                ON tool (in_code_tool_id)
+            """
+        )
+    )
 
-def downgrade() -> None:
+
+def upgrade() -> None:
     conn = op.get_bind()
 
+    # ON CONFLICT (in_code_tool_id) needs a unique arbiter index on tool
+    ensure_in_code_tool_id_unique_index(conn)
+
     conn.execute(
         sa.text(
             """
-            DELETE FROM persona__tool
-            WHERE tool_id IN (
-                SELECT id FROM tool WHERE in_code_tool_id = :in_code_tool_id
+            WITH upserted AS (
+                INSERT INTO tool
+                    (name, display_name, description, in_code_tool_id, enabled)
+                VALUES (:name, :display_name, :description, :in_code_tool_id, :enabled)
+                ON CONFLICT (in_code_tool_id) DO UPDATE
+                SET name = EXCLUDED.name,
+                    display_name = EXCLUDED.display_name,
+                    description = EXCLUDED.description,
+                    enabled = EXCLUDED.enabled
+                RETURNING id
             )
+            INSERT INTO persona__tool (persona_id, tool_id)
+            SELECT 0, id FROM upserted
+            ON CONFLICT (persona_id, tool_id) DO NOTHING
             """
         ),
-        {"in_code_tool_id": TOOL["in_code_tool_id"]},
+        TOOL,
     )
 
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    # persona__tool.tool_id is ON DELETE CASCADE (7ed603b64d5a), so this also
+    # removes the tool's persona links
     conn.execute(
-        sa.text(
-            """
-            DELETE FROM tool
-            WHERE in_code_tool_id = :in_code_tool_id
-            """
-        ),
+        sa.text("DELETE FROM tool WHERE in_code_tool_id = :in_code_tool_id"),
         {"in_code_tool_id": TOOL["in_code_tool_id"]},
     )
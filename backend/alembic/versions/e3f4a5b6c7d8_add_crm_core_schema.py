@@ -11,10 +11,13 @@ Create Date: 2026-02-19 21:00:00.000000
 
 """
 
+from alembic import context
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
+from shared_configs.configs import POSTGRES_DEFAULT_SCHEMA
+
 
 # revision identifiers, used by Alembic.
 revision = "e3f4a5b6c7d8"
@@ -99,52 +102,119 @@ ALL_CRM_TOOLS = [
 
 
 def _seed_crm_tools(conn: sa.engine.Connection) -> None:
-    for tool in ALL_CRM_TOOLS:
-        existing = conn.execute(
-            sa.text("SELECT id FROM tool WHERE in_code_tool_id = :in_code_tool_id"),
-            {"in_code_tool_id": tool["in_code_tool_id"]},
-        ).fetchone()
-
-        if existing:
-            tool_id = existing[0]
-            conn.execute(
-                sa.text(
-                    """
-                    UPDATE tool
-                    SET name = :name,
-                        display_name = :display_name,
-                        description = :description,
-                        enabled = :enabled
-                    WHERE id = :tool_id
-                    """
-                ),
-                {
-                    **tool,
-                    "tool_id": tool_id,
-                },
+    # ON CONFLICT (in_code_tool_id) needs uq_tool_in_code_tool_id, which
+    # databases that ran an older e2f3a4b5c6d7 may lack (and hold duplicate
+    # tools). That revision keeps the one copy of the merge-and-index helper;
+    # it is a no-op once the index exists.
+    index_owner = context.script.get_revision("e2f3a4b5c6d7")
+    assert index_owner is not None
+    index_owner.module.ensure_in_code_tool_id_unique_index(conn)
+
+    # Upsert every tool and link it to the default persona in one statement
+    # instead of a SELECT + UPDATE/INSERT round trip per tool.
+    values_sql = ",\n".join(
+        f"(:name_{i}, :display_name_{i}, :description_{i}, "
+        f":in_code_tool_id_{i}, :enabled_{i})"
+        for i in range(len(ALL_CRM_TOOLS))
+    )
+    params = {
+        f"{key}_{i}": value
+        for i, tool in enumerate(ALL_CRM_TOOLS)
+        for key, value in tool.items()
+    }
+    conn.execute(
+        sa.text(
+            f"""
+            WITH upserted AS (
+                INSERT INTO tool
+                    (name, display_name, description, in_code_tool_id, enabled)
+                VALUES {values_sql}
+                ON CONFLICT (in_code_tool_id) DO UPDATE
+                SET name = EXCLUDED.name,
+                    display_name = EXCLUDED.display_name,
+                    description = EXCLUDED.description,
+                    enabled = EXCLUDED.enabled
+                RETURNING id
             )
-        else:
-            tool_id = conn.execute(
-                sa.text(
-                    """
-                    INSERT INTO tool (name, display_name, description, in_code_tool_id, enabled)
-                    VALUES (:name, :display_name, :description, :in_code_tool_id, :enabled)
-                    RETURNING id
-                    """
-                ),
-                tool,
-            ).scalar_one()
-
-        conn.execute(
-            sa.text(
-                """
-                INSERT INTO persona__tool (persona_id, tool_id)
-                VALUES (0, :tool_id)
-                ON CONFLICT DO NOTHING
-                """
-            ),
-            {"tool_id": tool_id},
-        )
+            INSERT INTO persona__tool (persona_id, tool_id)
+            SELECT 0, id FROM upserted
+            ON CONFLICT (persona_id, tool_id) DO NOTHING
+            """
+        ),
+        params,
+    )
+
+
+# ---------------------------------------------------------------------------
+# search_tsv maintenance
+# ---------------------------------------------------------------------------
+
+# table -> (searchable source columns, weighted tsvector over the NEW row)
+CRM_SEARCH_TSV_SOURCES: dict[str, tuple[list[str], str]] = {
+    "crm_contact": (
+        ["first_name", "last_name", "email", "title", "notes"],
+        """
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.first_name, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.last_name, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.email, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.title, '')), 'C') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.notes, '')), 'D')
+        """,
+    ),
+    "crm_organization": (
+        ["name", "website", "sector", "notes"],
+        """
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.website, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.sector, '')), 'C') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.notes, '')), 'D')
+        """,
+    ),
+    "crm_interaction": (
+        ["title", "summary"],
+        """
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.summary, '')), 'B')
+        """,
+    ),
+}
+
+
+# index name -> (table, expression) for trigram indexes backing the
+# ILIKE '%query%' substring lookups on names and emails
+CRM_TRGM_INDEXES: dict[str, tuple[str, str]] = {
+    "ix_crm_contact_name_trgm": (
+        "crm_contact",
+        "(first_name || ' ' || coalesce(last_name, ''))",
+    ),
+    "ix_crm_contact_email_trgm": ("crm_contact", "email"),
+    "ix_crm_organization_name_trgm": ("crm_organization", "name"),
+    "ix_crm_tag_name_trgm": ("crm_tag", "name"),
+}
+
+
+def _create_search_tsv_trigger(table: str, columns: list[str], expression: str) -> None:
+    # Unlike a STORED generated column, which is recomputed on every row update,
+    # a trigger scoped to UPDATE OF the source columns leaves search_tsv (and its
+    # GIN entries) untouched when only unrelated columns such as status change.
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION {table}_search_tsv_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_tsv := {expression};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    source_columns = ", ".join(columns)
+    op.execute(
+        f"""
+        CREATE TRIGGER {table}_search_tsv_trigger
+        BEFORE INSERT OR UPDATE OF {source_columns} ON {table}
+        FOR EACH ROW EXECUTE FUNCTION {table}_search_tsv_update()
+        """
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -159,44 +229,28 @@ def upgrade() -> None:
     # Compatibility path for legacy prod schemas that already created CRM tables
     # through the old incremental chain ending at d7e8f9a0b1c2.
     if "crm_settings" in inspector.get_table_names():
+        # One round trip, and one ALTER per table so each is locked only once.
+        # now() is STABLE, not volatile, so updated_at gets a metadata-only
+        # fast default and crm_interaction is not rewritten.
         op.execute(
             """
             ALTER TABLE crm_settings
             ADD COLUMN IF NOT EXISTS contact_stage_options varchar[]
             NOT NULL
-            DEFAULT ARRAY['lead','active','inactive','archived']::varchar[];
-            """
-        )
-        op.execute(
-            """
-            ALTER TABLE crm_settings
+            DEFAULT ARRAY['lead','active','inactive','archived']::varchar[],
             ADD COLUMN IF NOT EXISTS contact_category_suggestions varchar[]
             NOT NULL
             DEFAULT ARRAY['Policy Maker','Journalist','Academic','Allied Org','Lab Member']::varchar[];
-            """
-        )
-        op.execute(
-            """
-            ALTER TABLE crm_contact
-            ADD COLUMN IF NOT EXISTS category varchar;
-            """
-        )
-        op.execute(
-            """
+
             ALTER TABLE crm_contact
+            ADD COLUMN IF NOT EXISTS category varchar,
             ALTER COLUMN status SET DEFAULT 'lead';
-            """
-        )
-        op.execute(
-            """
+
             ALTER TABLE crm_interaction
             ADD COLUMN IF NOT EXISTS updated_at timestamptz
             NOT NULL
             DEFAULT now();
-            """
-        )
-        op.execute(
-            """
+
             CREATE TABLE IF NOT EXISTS crm_contact_owner (
                 contact_id UUID NOT NULL,
                 user_id UUID NOT NULL,
@@ -205,10 +259,7 @@ def upgrade() -> None:
                 FOREIGN KEY (contact_id) REFERENCES crm_contact(id) ON DELETE CASCADE,
                 FOREIGN KEY (user_id) REFERENCES "user"(id) ON DELETE CASCADE
             );
-            """
-        )
-        op.execute(
-            """
+
             CREATE INDEX IF NOT EXISTS ix_crm_contact_owner_user_id
                 ON crm_contact_owner (user_id);
             """
@@ -286,6 +337,7 @@ def upgrade() -> None:
             nullable=False,
             server_default=sa.text("now()"),
         ),
+        sa.Column("search_tsv", postgresql.TSVECTOR(), nullable=True),
         sa.ForeignKeyConstraint(["created_by"], ["user.id"], ondelete="SET NULL"),
         sa.PrimaryKeyConstraint("id"),
     )
@@ -319,6 +371,7 @@ def upgrade() -> None:
             nullable=False,
             server_default=sa.text("now()"),
         ),
+        sa.Column("search_tsv", postgresql.TSVECTOR(), nullable=True),
         sa.ForeignKeyConstraint(
             ["organization_id"], ["crm_organization.id"], ondelete="SET NULL"
         ),
@@ -367,6 +420,7 @@ def upgrade() -> None:
             nullable=False,
             server_default=sa.text("now()"),
         ),
+        sa.Column("search_tsv", postgresql.TSVECTOR(), nullable=True),
         sa.ForeignKeyConstraint(
             ["contact_id"], ["crm_contact.id"], ondelete="SET NULL"
         ),
@@ -463,35 +517,30 @@ def upgrade() -> None:
     op.create_index(
         "ix_crm_organization_name_lower",
         "crm_organization",
-        [sa.text("lower(name)")],
+        [sa.func.lower(sa.column("name"))],
         unique=True,
     )
     op.create_index(
         "ix_crm_contact_email_lower",
         "crm_contact",
-        [sa.text("lower(email)")],
+        [sa.func.lower(sa.column("email"))],
         unique=True,
         postgresql_where=sa.text("email IS NOT NULL"),
     )
     op.create_index(
         "ix_crm_tag_name_lower",
         "crm_tag",
-        [sa.text("lower(name)")],
+        [sa.func.lower(sa.column("name"))],
         unique=True,
     )
 
-    # Interaction attendee indexes
-    op.create_index(
-        "ix_crm_interaction_attendee_interaction_id",
-        "crm_interaction_attendee",
-        ["interaction_id"],
-    )
+    # Interaction attendee indexes. The user index is not partial: NULL user_ids
+    # never conflict, and a full index also serves interaction_id lookups.
     op.create_index(
         "uq_crm_interaction_attendee_user",
         "crm_interaction_attendee",
         ["interaction_id", "user_id"],
         unique=True,
-        postgresql_where=sa.text("user_id IS NOT NULL"),
     )
     op.create_index(
         "uq_crm_interaction_attendee_contact",
@@ -509,73 +558,50 @@ def upgrade() -> None:
         unique=False,
     )
 
-    # Contact lookup indexes (from the model)
+    # Contact lookup indexes (from the model), ordered like the list views
     op.create_index(
-        "ix_crm_contact_organization_id",
+        "ix_crm_contact_organization_updated_at",
         "crm_contact",
-        ["organization_id"],
+        ["organization_id", sa.column("updated_at").desc()],
     )
     op.create_index(
-        "ix_crm_contact_status",
+        "ix_crm_contact_status_updated_at",
         "crm_contact",
-        ["status"],
+        ["status", sa.column("updated_at").desc()],
     )
 
-    # Interaction lookup indexes (from the model)
+    # Interaction lookup indexes (from the model), ordered like the timelines
     op.create_index(
-        "ix_crm_interaction_contact_id",
+        "ix_crm_interaction_contact_time",
         "crm_interaction",
-        ["contact_id"],
+        [
+            "contact_id",
+            sa.func.coalesce(sa.column("occurred_at"), sa.column("created_at")).desc(),
+        ],
     )
     op.create_index(
-        "ix_crm_interaction_organization_id",
+        "ix_crm_interaction_org_time",
         "crm_interaction",
-        ["organization_id"],
+        [
+            "organization_id",
+            sa.func.coalesce(sa.column("occurred_at"), sa.column("created_at")).desc(),
+        ],
     )
 
-    # ── Generated tsvector columns + GIN indexes ─────────────────────────
-    op.execute(
-        """
-        ALTER TABLE crm_contact
-        ADD COLUMN search_tsv tsvector GENERATED ALWAYS AS (
-            setweight(to_tsvector('english', coalesce(first_name, '')), 'A') ||
-            setweight(to_tsvector('english', coalesce(last_name, '')), 'A') ||
-            setweight(to_tsvector('english', coalesce(email, '')), 'B') ||
-            setweight(to_tsvector('english', coalesce(title, '')), 'C') ||
-            setweight(to_tsvector('english', coalesce(notes, '')), 'D')
-        ) STORED
-        """
-    )
-    op.execute(
-        """
-        ALTER TABLE crm_organization
-        ADD COLUMN search_tsv tsvector GENERATED ALWAYS AS (
-            setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
-            setweight(to_tsvector('english', coalesce(website, '')), 'B') ||
-            setweight(to_tsvector('english', coalesce(sector, '')), 'C') ||
-            setweight(to_tsvector('english', coalesce(notes, '')), 'D')
-        ) STORED
-        """
-    )
-    op.execute(
-        """
-        ALTER TABLE crm_interaction
-        ADD COLUMN search_tsv tsvector GENERATED ALWAYS AS (
-            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
-            setweight(to_tsvector('english', coalesce(summary, '')), 'B')
-        ) STORED
-        """
-    )
-
-    op.execute(
-        "CREATE INDEX ix_crm_contact_search_tsv ON crm_contact USING GIN (search_tsv)"
-    )
-    op.execute(
-        "CREATE INDEX ix_crm_organization_search_tsv ON crm_organization USING GIN (search_tsv)"
-    )
-    op.execute(
-        "CREATE INDEX ix_crm_interaction_search_tsv ON crm_interaction USING GIN (search_tsv)"
-    )
+    # ── search_tsv triggers + GIN indexes ────────────────────────────────
+    for table, (columns, expression) in CRM_SEARCH_TSV_SOURCES.items():
+        _create_search_tsv_trigger(table, columns, expression)
+
+    # ── GIN search_tsv and trigram indexes, in one round trip ────────────
+    gin_index_statements = [
+        f"CREATE INDEX ix_{table}_search_tsv ON {table} USING GIN (search_tsv)"
+        for table in CRM_SEARCH_TSV_SOURCES
+    ] + [
+        f"CREATE INDEX {index_name} ON {table} "
+        f"USING GIN ({expression} {POSTGRES_DEFAULT_SCHEMA}.gin_trgm_ops)"
+        for index_name, (table, expression) in CRM_TRGM_INDEXES.items()
+    ]
+    op.execute(";\n".join(gin_index_statements))
 
     # ── Seed CRM tools ────────────────────────────────────────────────────
     _seed_crm_tools(bind)
@@ -590,42 +616,29 @@ def downgrade() -> None:
     # Remove CRM tools
     conn = op.get_bind()
 
-    for tool in ALL_CRM_TOOLS:
-        conn.execute(
-            sa.text(
-                """
-                DELETE FROM persona__tool
-                WHERE tool_id IN (
-                    SELECT id FROM tool WHERE in_code_tool_id = :in_code_tool_id
-                )
-                """
-            ),
-            {"in_code_tool_id": tool["in_code_tool_id"]},
-        )
-
+    # persona__tool.tool_id is ON DELETE CASCADE (7ed603b64d5a), so this also
+    # removes the tools' persona links
     conn.execute(
-        sa.text(
-            """
-            DELETE FROM tool
-            WHERE in_code_tool_id IN (
-                'CrmSearchTool',
-                'CrmCreateTool',
-                'CrmUpdateTool',
-                'CrmLogInteractionTool',
-                'CrmListTool',
-                'CrmGetTool'
-            )
-            """
-        )
+        sa.text("DELETE FROM tool WHERE in_code_tool_id = ANY(:in_code_tool_ids)"),
+        {"in_code_tool_ids": [tool["in_code_tool_id"] for tool in ALL_CRM_TOOLS]},
+    )
+
+    # One statement drops every CRM table; each table's trigger goes with it,
+    # leaving only the trigger functions.
+    op.execute(
+        """
+        DROP TABLE
+            crm_organization__tag,
+            crm_contact__tag,
+            crm_tag,
+            crm_interaction_attendee,
+            crm_interaction,
+            crm_contact_owner,
+            crm_contact,
+            crm_organization,
+            crm_settings
+        """
     )
 
-    # Drop tables in reverse dependency order
-    op.drop_table("crm_organization__tag")
-    op.drop_table("crm_contact__tag")
-    op.drop_table("crm_tag")
-    op.drop_table("crm_interaction_attendee")
-    op.drop_table("crm_interaction")
-    op.drop_table("crm_contact_owner")
-    op.drop_table("crm_contact")
-    op.drop_table("crm_organization")
-    op.drop_table("crm_settings")
+    for table in CRM_SEARCH_TSV_SOURCES:
+        op.execute(f"DROP FUNCTION IF EXISTS {table}_search_tsv_update()")
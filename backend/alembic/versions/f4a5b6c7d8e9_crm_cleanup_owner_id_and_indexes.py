@@ -37,32 +37,17 @@ def upgrade() -> None:
 
     # ------------------------------------------------------------------
     # 2. Add missing indexes
-    #    (present on fresh DB from squashed migration; absent on prod)
-    #    Using CREATE INDEX IF NOT EXISTS for idempotency.
+    #    (absent on prod; 7b1d3f5a9e2c later swaps them for composites)
+    #    Using CREATE INDEX IF NOT EXISTS for idempotency, in one round trip.
     # ------------------------------------------------------------------
     op.execute(
         """
         CREATE INDEX IF NOT EXISTS ix_crm_contact_organization_id
             ON crm_contact (organization_id);
-        """
-    )
-
-    op.execute(
-        """
         CREATE INDEX IF NOT EXISTS ix_crm_contact_status
             ON crm_contact (status);
-        """
-    )
-
-    op.execute(
-        """
         CREATE INDEX IF NOT EXISTS ix_crm_interaction_contact_id
             ON crm_interaction (contact_id);
-        """
-    )
-
-    op.execute(
-        """
         CREATE INDEX IF NOT EXISTS ix_crm_interaction_organization_id
             ON crm_interaction (organization_id);
         """
@@ -73,7 +58,9 @@ def upgrade() -> None:
     #    The squashed migration creates these, but old prod may not have them.
     # ------------------------------------------------------------------
 
-    # ck_crm_settings_singleton  -- ensures crm_settings.id = 1
+    # Both probes share one DO block so the check costs a single round trip.
+    #   ck_crm_settings_singleton               -- ensures crm_settings.id = 1
+    #   ck_crm_interaction_attendee_one_target  -- exactly one of user_id / contact_id
     op.execute(
         """
         DO $$
@@ -87,16 +74,7 @@ def upgrade() -> None:
                 ALTER TABLE crm_settings
                     ADD CONSTRAINT ck_crm_settings_singleton CHECK (id = 1);
             END IF;
-        END
-        $$;
-        """
-    )
 
-    # ck_crm_interaction_attendee_one_target  -- exactly one of user_id / contact_id
-    op.execute(
-        """
-        DO $$
-        BEGIN
             IF NOT EXISTS (
                 SELECT 1
                 FROM pg_constraint
@@ -157,10 +135,15 @@ def downgrade() -> None:
     )
 
     # 2. Drop the indexes we added
-    op.execute("DROP INDEX IF EXISTS ix_crm_contact_organization_id;")
-    op.execute("DROP INDEX IF EXISTS ix_crm_contact_status;")
-    op.execute("DROP INDEX IF EXISTS ix_crm_interaction_contact_id;")
-    op.execute("DROP INDEX IF EXISTS ix_crm_interaction_organization_id;")
+    op.execute(
+        """
+        DROP INDEX IF EXISTS
+            ix_crm_contact_organization_id,
+            ix_crm_contact_status,
+            ix_crm_interaction_contact_id,
+            ix_crm_interaction_organization_id;
+        """
+    )
 
     # 1. Re-add the owner_id column (nullable UUID FK to user.id)
     op.execute(
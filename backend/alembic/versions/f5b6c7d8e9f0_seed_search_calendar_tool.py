@@ -9,6 +9,7 @@ Revises: f4a5b6c7d8e9
 Create Date: 2026-02-20 22:55:00.000000
 """
 
+from alembic import context
 from alembic import op
 import sqlalchemy as sa
 
@@ -36,74 +37,43 @@ TOOL = {
 def upgrade() -> None:
     conn = op.get_bind()
 
-    existing = conn.execute(
-        sa.text("SELECT id FROM tool WHERE in_code_tool_id = :in_code_tool_id"),
-        {"in_code_tool_id": TOOL["in_code_tool_id"]},
-    ).fetchone()
-
-    if existing:
-        tool_id = existing[0]
-        conn.execute(
-            sa.text(
-                """
-                UPDATE tool
-                SET name = :name,
-                    display_name = :display_name,
-                    description = :description,
-                    enabled = :enabled
-                WHERE id = :tool_id
-                """
-            ),
-            {
-                **TOOL,
-                "tool_id": tool_id,
-            },
-        )
-    else:
-        tool_id = conn.execute(
-            sa.text(
-                """
-                INSERT INTO tool (name, display_name, description, in_code_tool_id, enabled)
-                VALUES (:name, :display_name, :description, :in_code_tool_id, :enabled)
-                RETURNING id
-                """
-            ),
-            TOOL,
-        ).scalar_one()
+    # ON CONFLICT (in_code_tool_id) needs uq_tool_in_code_tool_id, which
+    # databases that ran an older e2f3a4b5c6d7 may lack (and hold duplicate
+    # tools). That revision keeps the one copy of the merge-and-index helper;
+    # it is a no-op once the index exists.
+    index_owner = context.script.get_revision("e2f3a4b5c6d7")
+    assert index_owner is not None
+    index_owner.module.ensure_in_code_tool_id_unique_index(conn)
 
     conn.execute(
         sa.text(
             """
+            WITH upserted AS (
+                INSERT INTO tool
+                    (name, display_name, description, in_code_tool_id, enabled)
+                VALUES (:name, :display_name, :description, :in_code_tool_id, :enabled)
+                ON CONFLICT (in_code_tool_id) DO UPDATE
+                SET name = EXCLUDED.name,
+                    display_name = EXCLUDED.display_name,
+                    description = EXCLUDED.description,
+                    enabled = EXCLUDED.enabled
+                RETURNING id
+            )
             INSERT INTO persona__tool (persona_id, tool_id)
-            VALUES (0, :tool_id)
-            ON CONFLICT DO NOTHING
+            SELECT 0, id FROM upserted
+            ON CONFLICT (persona_id, tool_id) DO NOTHING
             """
         ),
-        {"tool_id": tool_id},
+        TOOL,
     )
 
 
 def downgrade() -> None:
     conn = op.get_bind()
 
+    # persona__tool.tool_id is ON DELETE CASCADE (7ed603b64d5a), so this also
+    # removes the tool's persona links
     conn.execute(
-        sa.text(
-            """
-            DELETE FROM persona__tool
-            WHERE tool_id IN (
-                SELECT id FROM tool WHERE in_code_tool_id = :in_code_tool_id
-            )
-            """
-        ),
-        {"in_code_tool_id": TOOL["in_code_tool_id"]},
-    )
-
-    conn.execute(
-        sa.text(
-            """
-            DELETE FROM tool
-            WHERE in_code_tool_id = :in_code_tool_id
-            """
-        ),
+        sa.text("DELETE FROM tool WHERE in_code_tool_id = :in_code_tool_id"),
         {"in_code_tool_id": TOOL["in_code_tool_id"]},
     )
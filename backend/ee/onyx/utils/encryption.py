@@ -1,7 +1,6 @@
 from functools import lru_cache
 from os import urandom
 
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.ciphers import algorithms
 from cryptography.hazmat.primitives.ciphers import Cipher
@@ -9,10 +8,10 @@ from cryptography.hazmat.primitives.ciphers import modes
 
 from onyx.configs.app_configs import ENCRYPTION_KEY_SECRET
 from onyx.configs.app_configs import SECRET_ENCRYPTION_MODE
-from onyx.utils.logger import setup_logger
 from onyx.utils.variable_functionality import fetch_versioned_implementation
 
-logger = setup_logger()
+# Stateless; .padder()/.unpadder() hand out a fresh context per call
+_AES_PKCS7 = padding.PKCS7(algorithms.AES.block_size)
 
 
 @lru_cache(maxsize=1)
@@ -21,23 +20,17 @@ def _get_trimmed_key(key: str) -> bytes:
     key_length = len(encoded_key)
     if key_length < 16:
         raise RuntimeError("Invalid ENCRYPTION_KEY_SECRET - too short")
-    elif key_length > 32:
-        key = key[:32]
-    elif key_length not in (16, 24, 32):
-        valid_lengths = [16, 24, 32]
-        key = key[: min(valid_lengths, key=lambda x: abs(x - key_length))]
 
-    return key.encode()
+    # Longest AES key size that fits. Rounding to the nearest size instead left
+    # 21-23 and 29-31 byte secrets untrimmed, which AES rejects; every secret
+    # that worked before trims to the same key here.
+    return encoded_key[: max(size for size in (16, 24, 32) if size <= key_length)]
 
 
 @lru_cache(maxsize=1)
-def _warn_on_secret_encryption_mode_mismatch() -> None:
-    if SECRET_ENCRYPTION_MODE != "disabled":
-        logger.warning(
-            "SECRET_ENCRYPTION_MODE=%s is configured, but EE currently uses "
-            "ENCRYPTION_KEY_SECRET for credential encryption.",
-            SECRET_ENCRYPTION_MODE,
-        )
+def _get_aes_algorithm(key: str) -> algorithms.AES:
+    # Only the IV changes per call, so the validated key object is reused
+    return algorithms.AES(_get_trimmed_key(key))
 
 
 def _encrypt_string_aes_cbc(input_str: str) -> bytes:
@@ -47,12 +40,11 @@ def _encrypt_string_aes_cbc(input_str: str) -> bytes:
             "as plaintext. Set this environment variable before creating credentials."
         )
 
-    key = _get_trimmed_key(ENCRYPTION_KEY_SECRET)
     iv = urandom(16)
-    padder = padding.PKCS7(algorithms.AES.block_size).padder()
+    padder = _AES_PKCS7.padder()
     padded_data = padder.update(input_str.encode()) + padder.finalize()
 
-    cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
+    cipher = Cipher(_get_aes_algorithm(ENCRYPTION_KEY_SECRET), modes.CBC(iv))
     encryptor = cipher.encryptor()
     encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
 
@@ -71,15 +63,14 @@ def _decrypt_bytes_aes_cbc(input_bytes: bytes) -> str:
     if len(input_bytes) < 32:
         return input_bytes.decode()
 
-    key = _get_trimmed_key(ENCRYPTION_KEY_SECRET)
     iv = input_bytes[:16]
     encrypted_data = input_bytes[16:]
 
-    cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
+    cipher = Cipher(_get_aes_algorithm(ENCRYPTION_KEY_SECRET), modes.CBC(iv))
     decryptor = cipher.decryptor()
     decrypted_padded_data = decryptor.update(encrypted_data) + decryptor.finalize()
 
-    unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+    unpadder = _AES_PKCS7.unpadder()
     decrypted_data = unpadder.update(decrypted_padded_data) + unpadder.finalize()
 
     return decrypted_data.decode()
@@ -25,13 +25,25 @@ from onyx.redis.redis_pool import get_redis_client
 from onyx.redis.redis_pool import redis_lock_dump
 
 
-def _enqueue_run_task(task: Task, run_id: UUID, tenant_id: str) -> None:
-    task.app.send_task(
-        OnyxCeleryTask.RUN_CUSTOM_JOB,
-        kwargs={"run_id": str(run_id), "tenant_id": tenant_id},
-        queue=OnyxCeleryQueues.CSV_GENERATION,
-        priority=OnyxCeleryPriority.MEDIUM,
-    )
+def _enqueue_run_tasks(
+    task: Task, lock_beat: RedisLock, run_ids: list[UUID], tenant_id: str
+) -> None:
+    last_lock_time = time.monotonic()
+    # One pooled broker producer for the whole batch instead of one per send_task
+    with task.app.producer_or_acquire() as producer:
+        for run_id in run_ids:
+            current_time = time.monotonic()
+            if current_time - last_lock_time >= CELERY_GENERIC_BEAT_LOCK_TIMEOUT / 4:
+                lock_beat.reacquire()
+                last_lock_time = current_time
+
+            task.app.send_task(
+                OnyxCeleryTask.RUN_CUSTOM_JOB,
+                kwargs={"run_id": str(run_id), "tenant_id": tenant_id},
+                queue=OnyxCeleryQueues.CSV_GENERATION,
+                priority=OnyxCeleryPriority.MEDIUM,
+                producer=producer,
+            )
 
 
 @shared_task(
@@ -45,7 +57,6 @@ def check_for_custom_jobs(self: Task, *, tenant_id: str) -> int | None:
     if not ENABLE_CUSTOM_JOBS:
         return None
 
-    locked = False
     redis_client = get_redis_client(tenant_id=tenant_id)
     lock_beat: RedisLock = redis_client.lock(
         OnyxRedisLocks.CHECK_CUSTOM_JOBS_BEAT_LOCK,
@@ -57,7 +68,6 @@ def check_for_custom_jobs(self: Task, *, tenant_id: str) -> int | None:
 
     time_start = time.monotonic()
     try:
-        locked = True
         with get_session_with_current_tenant() as db_session:
             stale_runs = mark_stale_started_runs_failed(
                 db_session=db_session,
@@ -66,9 +76,9 @@ def check_for_custom_jobs(self: Task, *, tenant_id: str) -> int | None:
             due_runs = claim_due_scheduled_jobs(db_session=db_session)
             db_session.commit()
 
-            for run in due_runs:
-                lock_beat.reacquire()
-                _enqueue_run_task(self, run.id, tenant_id)
+        # Enqueue after the session closes so the pooled connection isn't held
+        # across broker round trips
+        _enqueue_run_tasks(self, lock_beat, [run.id for run in due_runs], tenant_id)
 
         task_logger.info(
             "check_for_custom_jobs finished: tenant=%s due_runs=%s stale_runs=%s elapsed=%.2fs",
@@ -85,15 +95,14 @@ def check_for_custom_jobs(self: Task, *, tenant_id: str) -> int | None:
         task_logger.exception("Unexpected error in check_for_custom_jobs.")
         return None
     finally:
-        if locked:
-            if lock_beat.owned():
-                lock_beat.release()
-            else:
-                task_logger.error(
-                    "check_for_custom_jobs - lock not owned on completion: tenant=%s",
-                    tenant_id,
-                )
-                redis_lock_dump(lock_beat, redis_client)
+        if lock_beat.owned():
+            lock_beat.release()
+        else:
+            task_logger.error(
+                "check_for_custom_jobs - lock not owned on completion: tenant=%s",
+                tenant_id,
+            )
+            redis_lock_dump(lock_beat, redis_client)
 
 
 @shared_task(
@@ -107,7 +116,6 @@ def check_for_custom_job_trigger_events(self: Task, *, tenant_id: str) -> int |
     if not ENABLE_CUSTOM_JOBS:
         return None
 
-    locked = False
     redis_client = get_redis_client(tenant_id=tenant_id)
     lock_beat: RedisLock = redis_client.lock(
         OnyxRedisLocks.CHECK_CUSTOM_JOB_TRIGGER_EVENTS_BEAT_LOCK,
@@ -118,14 +126,11 @@ def check_for_custom_job_trigger_events(self: Task, *, tenant_id: str) -> int |
         return None
 
     try:
-        locked = True
         with get_session_with_current_tenant() as db_session:
             runs = claim_trigger_events_for_runs(db_session=db_session)
             db_session.commit()
 
-        for run in runs:
-            lock_beat.reacquire()
-            _enqueue_run_task(self, run.id, tenant_id)
+        _enqueue_run_tasks(self, lock_beat, [run.id for run in runs], tenant_id)
 
         return len(runs)
     except SoftTimeLimitExceeded:
@@ -135,15 +140,14 @@ def check_for_custom_job_trigger_events(self: Task, *, tenant_id: str) -> int |
         task_logger.exception("Unexpected error in check_for_custom_job_trigger_events.")
         return None
     finally:
-        if locked:
-            if lock_beat.owned():
-                lock_beat.release()
-            else:
-                task_logger.error(
-                    "check_for_custom_job_trigger_events - lock not owned on completion: tenant=%s",
-                    tenant_id,
-                )
-                redis_lock_dump(lock_beat, redis_client)
+        if lock_beat.owned():
+            lock_beat.release()
+        else:
+            task_logger.error(
+                "check_for_custom_job_trigger_events - lock not owned on completion: tenant=%s",
+                tenant_id,
+            )
+            redis_lock_dump(lock_beat, redis_client)
 
 
 @shared_task(
@@ -161,7 +165,6 @@ def poll_custom_job_triggers(self: Task, *, tenant_id: str) -> int | None:  # no
     if not ENABLE_CUSTOM_JOBS:
         return None
 
-    locked = False
     redis_client = get_redis_client(tenant_id=tenant_id)
     lock_beat: RedisLock = redis_client.lock(
         OnyxRedisLocks.POLL_CUSTOM_JOB_TRIGGERS_BEAT_LOCK,
@@ -172,7 +175,6 @@ def poll_custom_job_triggers(self: Task, *, tenant_id: str) -> int | None:  # no
         return None
 
     try:
-        locked = True
         with get_session_with_current_tenant() as db_session:
             pending_trigger_jobs = fetch_pending_triggered_jobs(db_session=db_session)
         task_logger.debug(
@@ -188,15 +190,14 @@ def poll_custom_job_triggers(self: Task, *, tenant_id: str) -> int | None:  # no
         task_logger.exception("Unexpected error in poll_custom_job_triggers.")
         return None
     finally:
-        if locked:
-            if lock_beat.owned():
-                lock_beat.release()
-            else:
-                task_logger.error(
-                    "poll_custom_job_triggers - lock not owned on completion: tenant=%s",
-                    tenant_id,
-                )
-                redis_lock_dump(lock_beat, redis_client)
+        if lock_beat.owned():
+            lock_beat.release()
+        else:
+            task_logger.error(
+                "poll_custom_job_triggers - lock not owned on completion: tenant=%s",
+                tenant_id,
+            )
+            redis_lock_dump(lock_beat, redis_client)
 
 
 @shared_task(
@@ -210,7 +211,6 @@ def cleanup_custom_job_history_task(self: Task, *, tenant_id: str) -> int | None
     if not ENABLE_CUSTOM_JOBS:
         return None
 
-    locked = False
     redis_client = get_redis_client(tenant_id=tenant_id)
     lock_beat: RedisLock = redis_client.lock(
         OnyxRedisLocks.CLEANUP_CUSTOM_JOB_HISTORY_BEAT_LOCK,
@@ -221,7 +221,6 @@ def cleanup_custom_job_history_task(self: Task, *, tenant_id: str) -> int | None
         return None
 
     try:
-        locked = True
         with get_session_with_current_tenant() as db_session:
             deleted_rows = cleanup_custom_job_history(db_session=db_session)
             db_session.commit()
@@ -233,21 +232,21 @@ def cleanup_custom_job_history_task(self: Task, *, tenant_id: str) -> int | None
         task_logger.exception("Unexpected error in cleanup_custom_job_history_task.")
         return None
     finally:
-        if locked:
-            if lock_beat.owned():
-                lock_beat.release()
-            else:
-                task_logger.error(
-                    "cleanup_custom_job_history_task - lock not owned on completion: tenant=%s",
-                    tenant_id,
-                )
-                redis_lock_dump(lock_beat, redis_client)
+        if lock_beat.owned():
+            lock_beat.release()
+        else:
+            task_logger.error(
+                "cleanup_custom_job_history_task - lock not owned on completion: tenant=%s",
+                tenant_id,
+            )
+            redis_lock_dump(lock_beat, redis_client)
 
 
 @shared_task(
     name=OnyxCeleryTask.RUN_CUSTOM_JOB,
     acks_late=False,
-    track_started=True,
+    ignore_result=True,
+    trail=False,
     bind=True,
 )
 def run_custom_job(
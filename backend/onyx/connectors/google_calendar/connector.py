@@ -1,9 +1,10 @@
-import copy
+from collections.abc import Iterator
 from datetime import date
 from datetime import datetime
 from datetime import time
 from datetime import timedelta
 from datetime import timezone
+from functools import lru_cache
 from typing import Any
 from zoneinfo import ZoneInfo
 from zoneinfo import ZoneInfoNotFoundError
@@ -45,8 +46,11 @@ from onyx.connectors.models import HierarchyNode
 from onyx.connectors.models import SlimDocument
 from onyx.connectors.models import TextSection
 from onyx.file_processing.html_utils import parse_html_page_basic
+from onyx.file_processing.html_utils import strip_excessive_newlines_and_spaces
+from onyx.file_processing.html_utils import strip_newlines
 from onyx.indexing.indexing_heartbeat import IndexingHeartbeatInterface
 from onyx.utils.logger import setup_logger
+from onyx.utils.threadpool_concurrency import parallel_yield
 
 logger = setup_logger()
 
@@ -54,19 +58,22 @@ DEFAULT_LOOKBACK_DAYS = 30
 DEFAULT_LOOKAHEAD_DAYS = 365
 EVENT_PAGE_SIZE = 250
 PAGES_PER_CHECKPOINT = 1
+# Google recommends keeping batch requests to 50 calls or fewer
+CALENDAR_NAME_BATCH_SIZE = 50
+MAX_CALENDAR_WORKERS = 8
 
 CALENDAR_LIST_FIELDS = "nextPageToken,items(id,summary)"
-EVENT_LIST_FIELDS = (
-    "nextPageToken,items("
-    "id,status,summary,description,updated,"
+EVENT_CORE_FIELDS = (
+    "id,status,summary,updated,"
     "start,end,"
     "organizer(email,displayName),"
-    "attendees(email,displayName,responseStatus,self),"
     "htmlLink,location,hangoutLink,"
     "conferenceData(entryPoints(uri,entryPointType)),"
     "recurringEventId"
-    ")"
 )
+EVENT_ATTENDEE_FIELDS = "attendees(email,displayName,responseStatus,self)"
+# Slim retrieval only needs what the id and the skip checks read
+SLIM_EVENT_LIST_FIELDS = "nextPageToken,items(id,status,attendees(responseStatus,self))"
 
 
 def _csv_to_str_list(raw_value: str | None) -> list[str]:
@@ -79,6 +86,17 @@ def _deduplicate(values: list[str]) -> list[str]:
     return list(dict.fromkeys(values))
 
 
+def _build_event_list_fields(include_description: bool, include_attendees: bool) -> str:
+    # Descriptions and attendee lists are often the bulk of an event payload,
+    # so only request them when they will be used
+    item_fields = [EVENT_CORE_FIELDS]
+    if include_description:
+        item_fields.append("description")
+    if include_attendees:
+        item_fields.append(EVENT_ATTENDEE_FIELDS)
+    return f"nextPageToken,items({','.join(item_fields)})"
+
+
 def _to_rfc3339(timestamp: datetime) -> str:
     return timestamp.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
 
@@ -87,11 +105,15 @@ def _parse_rfc3339(timestamp: str | None) -> datetime | None:
     if not timestamp:
         return None
     try:
-        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        # Python 3.11+ parses the trailing "Z" natively
+        return datetime.fromisoformat(timestamp)
     except ValueError:
         return None
 
 
+# ZoneInfo already caches the zones it finds, but not failed lookups: without
+# this, every all-day event in an unknown zone re-searches tzdata and re-logs.
+@lru_cache(maxsize=128)
 def _safe_timezone(timezone_name: str | None) -> ZoneInfo:
     if timezone_name:
         try:
@@ -162,16 +184,30 @@ def _format_attendee(attendee: dict[str, Any]) -> str:
     attendee_email = attendee.get("email")
     attendee_name = attendee.get("displayName")
     response_status = attendee.get("responseStatus")
-
+    # Only str values are forwarded, so the cache key is always hashable
+    return _format_attendee_fields(
+        attendee_email if isinstance(attendee_email, str) else None,
+        attendee_name if isinstance(attendee_name, str) else None,
+        response_status if isinstance(response_status, str) else None,
+    )
+
+
+# Expanded recurring events repeat the same attendee lists on every occurrence
+@lru_cache(maxsize=4096)
+def _format_attendee_fields(
+    attendee_email: str | None,
+    attendee_name: str | None,
+    response_status: str | None,
+) -> str:
     participant_name = None
-    if isinstance(attendee_name, str) and attendee_name.strip():
+    if attendee_name and attendee_name.strip():
         participant_name = attendee_name.strip()
-    elif isinstance(attendee_email, str) and attendee_email.strip():
+    elif attendee_email and attendee_email.strip():
         participant_name = attendee_email.strip()
     else:
         participant_name = "Unknown attendee"
 
-    if isinstance(response_status, str) and response_status.strip():
+    if response_status and response_status.strip():
         return f"{participant_name} ({response_status.strip()})"
 
     return participant_name
@@ -201,6 +237,11 @@ class GoogleCalendarConnector(
         self.include_declined_events = include_declined_events
         self.include_event_descriptions = include_event_descriptions
         self.include_attendees = include_attendees
+        # Attendees are also needed to spot events the user declined
+        self._event_list_fields = _build_event_list_fields(
+            include_description=include_event_descriptions,
+            include_attendees=include_attendees or not include_declined_events,
+        )
 
         self._creds: OAuthCredentials | ServiceAccountCredentials | None = None
         self._calendar_service: GoogleCalendarService | None = None
@@ -251,23 +292,48 @@ class GoogleCalendarConnector(
         return new_creds_dict
 
     def _ensure_calendar_names(self, calendar_ids: list[str]) -> None:
-        for calendar_id in calendar_ids:
-            if calendar_id in self._calendar_names:
-                continue
+        missing_calendar_ids = [
+            calendar_id
+            for calendar_id in calendar_ids
+            if calendar_id not in self._calendar_names
+        ]
 
-            try:
-                calendar = (
-                    self.calendar_service.calendarList()
-                    .get(calendarId=calendar_id, fields="id,summary")
-                    .execute()
+        def _on_calendar_response(
+            request_id: str,
+            response: dict[str, Any] | None,
+            exception: Exception | None,
+        ) -> None:
+            summary = response.get("summary") if response and not exception else None
+            if isinstance(summary, str) and summary.strip():
+                self._calendar_names[request_id] = summary.strip()
+            else:
+                self._calendar_names[request_id] = request_id
+
+        # One HTTP round trip per batch instead of one per calendar
+        for batch_start in range(
+            0, len(missing_calendar_ids), CALENDAR_NAME_BATCH_SIZE
+        ):
+            batch = self.calendar_service.new_batch_http_request(
+                callback=_on_calendar_response
+            )
+            for calendar_id in missing_calendar_ids[
+                batch_start : batch_start + CALENDAR_NAME_BATCH_SIZE
+            ]:
+                batch.add(
+                    self.calendar_service.calendarList().get(
+                        calendarId=calendar_id, fields="id,summary"
+                    ),
+                    request_id=calendar_id,
                 )
-                summary = calendar.get("summary")
-                if isinstance(summary, str) and summary.strip():
-                    self._calendar_names[calendar_id] = summary.strip()
-                else:
-                    self._calendar_names[calendar_id] = calendar_id
+            try:
+                batch.execute()
             except Exception:
-                self._calendar_names[calendar_id] = calendar_id
+                logger.warning(
+                    "Failed to fetch Google Calendar names, using calendar ids instead."
+                )
+
+        for calendar_id in missing_calendar_ids:
+            self._calendar_names.setdefault(calendar_id, calendar_id)
 
     def _resolve_calendar_ids(self) -> list[str]:
         if self._configured_calendar_ids:
@@ -305,13 +371,15 @@ class GoogleCalendarConnector(
         self,
         start: SecondsSinceUnixEpoch,
         page_token: str | None = None,
+        fields: str | None = None,
+        now: datetime | None = None,
     ) -> dict[str, Any]:
-        now = datetime.now(tz=timezone.utc)
+        now = now or datetime.now(tz=timezone.utc)
         horizon_start = now - timedelta(days=self.lookback_days)
         horizon_end = now + timedelta(days=self.lookahead_days)
 
         kwargs: dict[str, Any] = {
-            "fields": EVENT_LIST_FIELDS,
+            "fields": fields or self._event_list_fields,
             "maxResults": EVENT_PAGE_SIZE,
             "showDeleted": True,
             "singleEvents": True,
@@ -334,18 +402,24 @@ class GoogleCalendarConnector(
         calendar_id: str,
         start: SecondsSinceUnixEpoch,
         page_token: str | None,
+        calendar_service: GoogleCalendarService | None = None,
+        fields: str | None = None,
+        now: datetime | None = None,
     ) -> tuple[list[dict[str, Any]], str | None]:
+        service = calendar_service or self.calendar_service
         events: list[dict[str, Any]] = []
         next_page_token: str | None = None
 
         request_kwargs = self._build_events_request_kwargs(
             start=start,
             page_token=page_token,
+            fields=fields,
+            now=now,
         )
 
         for event_or_next_page_token in execute_paginated_retrieval_with_max_pages(
             max_num_pages=PAGES_PER_CHECKPOINT,
-            retrieval_function=self.calendar_service.events().list,
+            retrieval_function=service.events().list,
             list_key="items",
             calendarId=calendar_id,
             **request_kwargs,
@@ -423,8 +497,15 @@ class GoogleCalendarConnector(
         description_text = ""
         raw_description = event.get("description")
         if self.include_event_descriptions and isinstance(raw_description, str):
-            cleaned_description = parse_html_page_basic(raw_description).strip()
-            description_text = cleaned_description or raw_description.strip()
+            if "<" not in raw_description and "&" not in raw_description:
+                # Plain text (no tags or entities): apply the parser's whitespace
+                # normalization directly so the indexed text stays the same
+                description_text = strip_excessive_newlines_and_spaces(
+                    strip_newlines(raw_description)
+                )
+            else:
+                cleaned_description = parse_html_page_basic(raw_description).strip()
+                description_text = cleaned_description or raw_description.strip()
 
         section_lines = [
             f"Title: {semantic_identifier}",
@@ -496,7 +577,11 @@ class GoogleCalendarConnector(
         start: SecondsSinceUnixEpoch,
         checkpoint: GoogleCalendarCheckpoint,
     ) -> CheckpointOutput[GoogleCalendarCheckpoint]:
-        checkpoint = copy.deepcopy(checkpoint)
+        # page_tokens is the only field mutated in place, so copy just that
+        # instead of deep-copying the whole checkpoint every step
+        checkpoint = checkpoint.model_copy(
+            update={"page_tokens": dict(checkpoint.page_tokens)}
+        )
 
         if checkpoint.calendar_ids is None:
             checkpoint.calendar_ids = self._resolve_calendar_ids()
@@ -572,6 +657,41 @@ class GoogleCalendarConnector(
                 raise PermissionError(ONYX_SCOPE_INSTRUCTIONS) from e
             raise e
 
+    def _iter_slim_docs_for_calendar(
+        self, calendar_id: str, now: datetime
+    ) -> Iterator[SlimDocument]:
+        # Runs on a parallel_yield worker thread, and the underlying httplib2
+        # transport is not thread-safe, so each calendar gets its own service.
+        calendar_service = self._build_calendar_service()
+        page_token: str | None = None
+
+        while True:
+            # Slim retrieval is used for reconciliation / pruning and should
+            # represent the current full in-scope horizon rather than a
+            # checkpoint window.
+            query_start = 0
+            events, next_page_token = self._fetch_calendar_events_page(
+                calendar_id=calendar_id,
+                start=query_start,
+                page_token=page_token,
+                calendar_service=calendar_service,
+                fields=SLIM_EVENT_LIST_FIELDS,
+                now=now,
+            )
+            for event in events:
+                if self._should_skip_event(event):
+                    continue
+
+                event_id = event.get("id")
+                if not isinstance(event_id, str) or not event_id:
+                    continue
+
+                yield SlimDocument(id=f"google_calendar:{calendar_id}:{event_id}")
+
+            if not next_page_token:
+                break
+            page_token = next_page_token
+
     @override
     def retrieve_all_slim_docs(
         self,
@@ -583,47 +703,28 @@ class GoogleCalendarConnector(
             slim_docs_batch: list[SlimDocument | HierarchyNode] = []
 
             calendar_ids = self._resolve_calendar_ids()
-            for calendar_id in calendar_ids:
-                page_token: str | None = None
-
-                while True:
-                    # Slim retrieval is used for reconciliation / pruning and should
-                    # represent the current full in-scope horizon rather than a
-                    # checkpoint window.
-                    query_start = 0
-                    events, next_page_token = self._fetch_calendar_events_page(
-                        calendar_id=calendar_id,
-                        start=query_start,
-                        page_token=page_token,
-                    )
-                    for event in events:
-                        if self._should_skip_event(event):
-                            continue
-
-                        event_id = event.get("id")
-                        if not isinstance(event_id, str) or not event_id:
-                            continue
-
-                        slim_docs_batch.append(
-                            SlimDocument(
-                                id=f"google_calendar:{calendar_id}:{event_id}",
-                            )
-                        )
-
-                        if len(slim_docs_batch) >= SLIM_BATCH_SIZE:
-                            yield slim_docs_batch
-                            slim_docs_batch = []
-
-                            if callback:
-                                if callback.should_stop():
-                                    return
-                                callback.progress(
-                                    "google_calendar_retrieve_all_slim_docs", 1
-                                )
-
-                    if not next_page_token:
-                        break
-                    page_token = next_page_token
+            # Every page of every calendar is queried against the same horizon,
+            # so the pages of one listing can't drift apart between requests
+            now = datetime.now(tz=timezone.utc)
+            # Calendars are paged concurrently so their page latencies overlap
+            # instead of adding up.
+            calendar_gens = [
+                self._iter_slim_docs_for_calendar(calendar_id, now)
+                for calendar_id in calendar_ids
+            ]
+            for slim_doc in parallel_yield(
+                calendar_gens, max_workers=MAX_CALENDAR_WORKERS
+            ):
+                slim_docs_batch.append(slim_doc)
+
+                if len(slim_docs_batch) >= SLIM_BATCH_SIZE:
+                    yield slim_docs_batch
+                    slim_docs_batch = []
+
+                    if callback:
+                        if callback.should_stop():
+                            return
+                        callback.progress("google_calendar_retrieve_all_slim_docs", 1)
 
             if slim_docs_batch:
                 yield slim_docs_batch
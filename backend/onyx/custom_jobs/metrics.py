@@ -35,6 +35,13 @@ _STEP_KEY_TO_EXTERNAL_API = {
     "summarize_weekly_content": "llm",
 }
 
+# Bound once at import: the label sets are static, and binding them up front
+# also exports each series at zero before its first error.
+_EXTERNAL_API_ERROR_COUNTERS = {
+    step_key: CUSTOM_JOB_EXTERNAL_API_ERRORS_TOTAL.labels(step_key=step_key, api=api)
+    for step_key, api in _STEP_KEY_TO_EXTERNAL_API.items()
+}
+
 
 def record_run_terminal(*, status: str, workflow_key: str) -> None:
     CUSTOM_JOB_RUNS_TOTAL.labels(status=status, workflow_key=workflow_key).inc()
@@ -53,7 +60,7 @@ def record_step_failure(*, step_key: str, workflow_key: str) -> None:
 
 
 def record_external_api_error(*, step_key: str) -> None:
-    api = _STEP_KEY_TO_EXTERNAL_API.get(step_key)
-    if api is None:
+    counter = _EXTERNAL_API_ERROR_COUNTERS.get(step_key)
+    if counter is None:
         return
-    CUSTOM_JOB_EXTERNAL_API_ERRORS_TOTAL.labels(step_key=step_key, api=api).inc()
+    counter.inc()
@@ -314,7 +314,10 @@ def list_contacts(
         if query:
             ts_query = func.websearch_to_tsquery("english", query)
             like_q = f"%{_escape_like_query(query)}%"
-            full_name = func.concat_ws(" ", CrmContact.first_name, CrmContact.last_name)
+            # Must match the ix_crm_contact_name_trgm expression for index use
+            full_name = (
+                CrmContact.first_name + " " + func.coalesce(CrmContact.last_name, "")
+            )
             stmt = stmt.where(
                 or_(
                     CrmContact.search_tsv.op("@@")(ts_query),
@@ -1101,6 +1104,11 @@ def find_contacts_for_attendee_resolution(
     escaped_token = _escape_like_query(token)
     like_q = f"%{escaped_token}%"
     full_name = func.concat_ws(" ", CrmContact.first_name, CrmContact.last_name)
+    # Matches the ix_crm_contact_name_trgm expression; every other name/email
+    # predicate implies one of the two trigram-indexed ILIKEs below.
+    indexed_full_name = (
+        CrmContact.first_name + " " + func.coalesce(CrmContact.last_name, "")
+    )
     priority = case(
         (func.lower(CrmContact.email) == token_lower, 0),
         (func.lower(full_name) == token_lower, 1),
@@ -1116,11 +1124,7 @@ def find_contacts_for_attendee_resolution(
             select(CrmContact)
             .where(
                 or_(
-                    func.lower(CrmContact.email) == token_lower,
-                    func.lower(full_name) == token_lower,
-                    full_name.ilike(like_q, escape="\\"),
-                    CrmContact.first_name.ilike(like_q, escape="\\"),
-                    CrmContact.last_name.ilike(like_q, escape="\\"),
+                    indexed_full_name.ilike(like_q, escape="\\"),
                     CrmContact.email.ilike(like_q, escape="\\"),
                 )
             )
@@ -21,10 +21,10 @@ from fastapi_users_db_sqlalchemy import SQLAlchemyBaseUserTableUUID
 from fastapi_users_db_sqlalchemy.access_token import SQLAlchemyBaseAccessTokenTableUUID
 from fastapi_users_db_sqlalchemy.generics import TIMESTAMPAware
 from sqlalchemy import Boolean
-from sqlalchemy import Computed
 from sqlalchemy import DateTime
 from sqlalchemy import desc
 from sqlalchemy import Enum
+from sqlalchemy import FetchedValue
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
@@ -112,6 +112,7 @@ from onyx.utils.encryption import decrypt_bytes_to_string
 from onyx.utils.encryption import encrypt_string_to_bytes
 from onyx.utils.sensitive import SensitiveValue
 from onyx.utils.headers import HeaderItemDict
+from onyx.utils.uuid7 import uuid7
 from shared_configs.enums import EmbeddingProvider
 from onyx.context.search.enums import RecencyBiasSetting
 
@@ -2655,7 +2656,14 @@ class ChatMessage(Base):
         back_populates="chat_messages",
     )
 
-    __table_args__ = (Index("ix_chat_message_time_sent", "time_sent"),)
+    __table_args__ = (
+        Index(
+            "ix_chat_message_time_sent",
+            "time_sent",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
 
 class ToolCall(Base):
@@ -2866,7 +2874,9 @@ class LLMProvider(Base):
     api_base: Mapped[str | None] = mapped_column(String, nullable=True)
     api_version: Mapped[str | None] = mapped_column(String, nullable=True)
     # custom configs that should be passed to the LLM provider at inference time
-    # (e.g. `AWS_ACCESS_KEY_ID`, `AWS_SECRET_ACCESS_KEY`, etc. for bedrock)
+    # (e.g. `AWS_ACCESS_KEY_ID`, `AWS_SECRET_ACCESS_KEY`, etc. for bedrock).
+    # Encrypted as a single blob: keys are provider-defined, so there is no fixed
+    # set of non-secret leaves to keep queryable, and nothing filters on them.
     custom_config: Mapped[dict[str, str] | None] = mapped_column(
         EncryptedJsonUnmasked(), nullable=True
     )
@@ -3190,6 +3200,8 @@ class Tool(Base):
         "MCPServer", back_populates="current_actions"
     )
 
+    __table_args__ = (Index("uq_tool_in_code_tool_id", "in_code_tool_id", unique=True),)
+
 
 class OAuthConfig(Base):
     """OAuth provider configuration that can be shared across multiple tools"""
@@ -4363,16 +4375,16 @@ class CrmOrganization(Base):
         onupdate=func.now(),
         nullable=False,
     )
+    # Maintained by the crm_organization_search_tsv_trigger database trigger
     search_tsv: Mapped[str | None] = mapped_column(
         postgresql.TSVECTOR,
-        Computed(
-            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
-            "setweight(to_tsvector('english', coalesce(website, '')), 'B') || "
-            "setweight(to_tsvector('english', coalesce(sector, '')), 'C') || "
-            "setweight(to_tsvector('english', coalesce(notes, '')), 'D')",
-            persisted=True,
-        ),
         nullable=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+    )
+
+    __table_args__ = (
+        Index("ix_crm_organization_name_lower", func.lower(name), unique=True),
     )
 
 
@@ -4418,17 +4430,12 @@ class CrmContact(Base):
         onupdate=func.now(),
         nullable=False,
     )
+    # Maintained by the crm_contact_search_tsv_trigger database trigger
     search_tsv: Mapped[str | None] = mapped_column(
         postgresql.TSVECTOR,
-        Computed(
-            "setweight(to_tsvector('english', coalesce(first_name, '')), 'A') || "
-            "setweight(to_tsvector('english', coalesce(last_name, '')), 'A') || "
-            "setweight(to_tsvector('english', coalesce(email, '')), 'B') || "
-            "setweight(to_tsvector('english', coalesce(title, '')), 'C') || "
-            "setweight(to_tsvector('english', coalesce(notes, '')), 'D')",
-            persisted=True,
-        ),
         nullable=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
     )
 
     owners: Mapped[list["CrmContactOwner"]] = relationship(
@@ -4436,8 +4443,18 @@ class CrmContact(Base):
     )
 
     __table_args__ = (
-        Index("ix_crm_contact_organization_id", "organization_id"),
-        Index("ix_crm_contact_status", "status"),
+        Index(
+            "ix_crm_contact_email_lower",
+            func.lower(email),
+            unique=True,
+            postgresql_where=email.isnot(None),
+        ),
+        Index(
+            "ix_crm_contact_organization_updated_at",
+            "organization_id",
+            desc("updated_at"),
+        ),
+        Index("ix_crm_contact_status_updated_at", "status", desc("updated_at")),
     )
 
 
@@ -4500,19 +4517,26 @@ class CrmInteraction(Base):
         onupdate=func.now(),
         nullable=False,
     )
+    # Maintained by the crm_interaction_search_tsv_trigger database trigger
     search_tsv: Mapped[str | None] = mapped_column(
         postgresql.TSVECTOR,
-        Computed(
-            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
-            "setweight(to_tsvector('english', coalesce(summary, '')), 'B')",
-            persisted=True,
-        ),
         nullable=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
     )
 
+    # Match the list_interactions timeline ordering
     __table_args__ = (
-        Index("ix_crm_interaction_contact_id", "contact_id"),
-        Index("ix_crm_interaction_organization_id", "organization_id"),
+        Index(
+            "ix_crm_interaction_contact_time",
+            contact_id,
+            func.coalesce(occurred_at, created_at).desc(),
+        ),
+        Index(
+            "ix_crm_interaction_org_time",
+            organization_id,
+            func.coalesce(occurred_at, created_at).desc(),
+        ),
     )
 
 
@@ -4550,12 +4574,12 @@ class CrmInteractionAttendee(Base):
             "(user_id IS NULL AND contact_id IS NOT NULL)",
             name="ck_crm_interaction_attendee_one_target",
         ),
+        # Not partial, so it also serves lookups by interaction_id alone
         Index(
             "uq_crm_interaction_attendee_user",
             "interaction_id",
             "user_id",
             unique=True,
-            postgresql_where=text("user_id IS NOT NULL"),
         ),
         Index(
             "uq_crm_interaction_attendee_contact",
@@ -5185,8 +5209,9 @@ class CustomJob(Base):
 class CustomJobRun(Base):
     __tablename__ = "custom_job_run"
 
+    # Time-ordered so inserts append to the primary key index
     id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True), primary_key=True, default=uuid4
+        PGUUID(as_uuid=True), primary_key=True, default=uuid7
     )
     custom_job_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -5255,15 +5280,27 @@ class CustomJobRun(Base):
             postgresql_where=text("idempotency_key IS NOT NULL"),
         ),
         Index("ix_custom_job_run_job_created", "custom_job_id", desc("created_at")),
-        Index("ix_custom_job_run_status", "status"),
+        Index(
+            "ix_custom_job_run_active",
+            "custom_job_id",
+            "status",
+            postgresql_where=text("status IN ('PENDING', 'STARTED')"),
+        ),
+        Index(
+            "ix_custom_job_run_trigger_event_id",
+            "trigger_event_id",
+            postgresql_where=text("trigger_event_id IS NOT NULL"),
+        ),
     )
 
 
 class CustomJobRunStep(Base):
     __tablename__ = "custom_job_run_step"
+    # Created with fillfactor = 70 (see migrations) so status updates stay HOT.
 
+    # Time-ordered so inserts append to the primary key index
     id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True), primary_key=True, default=uuid4
+        PGUUID(as_uuid=True), primary_key=True, default=uuid7
     )
     run_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -5292,15 +5329,15 @@ class CustomJobRunStep(Base):
     __table_args__ = (
         UniqueConstraint("run_id", "step_index", name="uq_custom_job_run_step_index"),
         UniqueConstraint("run_id", "step_id", name="uq_custom_job_run_step_id"),
-        Index("ix_custom_job_run_step_run", "run_id", "step_index"),
     )
 
 
 class CustomJobTriggerEvent(Base):
     __tablename__ = "custom_job_trigger_event"
 
+    # Time-ordered so inserts append to the primary key index
     id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True), primary_key=True, default=uuid4
+        PGUUID(as_uuid=True), primary_key=True, default=uuid7
     )
     custom_job_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -5342,12 +5379,10 @@ class CustomJobTriggerEvent(Base):
             name="uq_custom_job_trigger_event_dedupe",
         ),
         Index(
-            "ix_custom_job_trigger_event_claim",
-            "custom_job_id",
-            "status",
-            "event_time",
+            "ix_custom_job_trigger_event_received",
+            event_time.asc().nulls_first(),
+            postgresql_where=text("status = 'RECEIVED'"),
         ),
-        Index("ix_custom_job_trigger_event_status", "status"),
     )
 
 
@@ -5378,8 +5413,9 @@ class CustomJobTriggerState(Base):
 class CustomJobAuditLog(Base):
     __tablename__ = "custom_job_audit_log"
 
+    # Time-ordered so inserts append to the primary key index
     id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True), primary_key=True, default=uuid4
+        PGUUID(as_uuid=True), primary_key=True, default=uuid7
     )
     custom_job_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -5409,6 +5445,11 @@ class CustomJobAuditLog(Base):
             "custom_job_id",
             desc("created_at"),
         ),
+        Index(
+            "ix_custom_job_audit_log_user_id",
+            "user_id",
+            postgresql_where=text("user_id IS NOT NULL"),
+        ),
     )
 
 
@@ -243,7 +243,6 @@ def _encrypt_string(input_str: str) -> bytes:
 def _decrypt_legacy_aes_cbc(input_bytes: bytes) -> str:
     """Decrypt data encrypted with the old AES-CBC scheme (ENCRYPTION_KEY_SECRET).
     Used as a fallback during migration from the legacy EE encryption to KMS."""
-    from cryptography.hazmat.backends import default_backend
     from cryptography.hazmat.primitives import padding
     from cryptography.hazmat.primitives.ciphers import algorithms
     from cryptography.hazmat.primitives.ciphers import Cipher
@@ -254,21 +253,19 @@ def _decrypt_legacy_aes_cbc(input_bytes: bytes) -> str:
             "Cannot decrypt legacy AES-CBC data: ENCRYPTION_KEY_SECRET is not set."
         )
 
+    # Same trimming as the EE AES-CBC key: the longest AES key size that fits
     encoded_key = ENCRYPTION_KEY_SECRET.encode()
     key_length = len(encoded_key)
-    if key_length > 32:
-        key = ENCRYPTION_KEY_SECRET[:32].encode()
-    elif key_length not in (16, 24, 32):
-        valid_lengths = [16, 24, 32]
-        trim_to = min(valid_lengths, key=lambda x: abs(x - key_length))
-        key = ENCRYPTION_KEY_SECRET[:trim_to].encode()
-    else:
-        key = encoded_key
+    if key_length < 16:
+        raise RuntimeError(
+            "Cannot decrypt legacy AES-CBC data: ENCRYPTION_KEY_SECRET is too short."
+        )
+    key = encoded_key[: max(size for size in (16, 24, 32) if size <= key_length)]
 
     iv = input_bytes[:16]
     encrypted_data = input_bytes[16:]
 
-    cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
+    cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
     decryptor = cipher.decryptor()
     decrypted_padded = decryptor.update(encrypted_data) + decryptor.finalize()
 
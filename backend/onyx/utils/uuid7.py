@@ -0,0 +1,28 @@
+import os
+import time
+from uuid import UUID
+
+_TIMESTAMP_MASK = (1 << 48) - 1
+_RAND_B_MASK = (1 << 62) - 1
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The leading 48 bits are the Unix timestamp in milliseconds, so ids created
+    later sort later. Used as the primary key default for append-heavy tables,
+    where random uuid4 keys scatter inserts across the whole primary key btree.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = rand >> 68
+    rand_b = rand & _RAND_B_MASK
+
+    value = (
+        (timestamp_ms & _TIMESTAMP_MASK) << 80
+        | 0x7 << 76  # version
+        | rand_a << 64
+        | 0b10 << 62  # RFC 4122 variant
+        | rand_b
+    )
+    return UUID(int=value)
@@ -1,11 +1,16 @@
 from datetime import datetime
 from datetime import timezone
+from typing import Any
+from typing import Callable
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from onyx.configs.constants import DocumentSource
 from onyx.connectors.google_calendar.connector import GoogleCalendarConnector
+from onyx.connectors.google_calendar.connector import SLIM_EVENT_LIST_FIELDS
 from onyx.connectors.google_calendar.models import GoogleCalendarCheckpoint
 from onyx.connectors.models import Document
+from onyx.connectors.models import SlimDocument
 from onyx.connectors.models import TextSection
 from tests.unit.onyx.connectors.utils import (
     load_everything_from_checkpoint_connector_from_checkpoint,
@@ -52,6 +57,29 @@ def test_event_to_document() -> None:
     assert "Review launch blockers" in doc.sections[0].text
 
 
+def test_event_to_document_skips_html_parsing_for_plain_text() -> None:
+    connector = GoogleCalendarConnector(include_event_descriptions=True)
+
+    event = {
+        "id": "abc123",
+        "summary": "Product Sync",
+        "description": "  Agenda:\n1. Launch blockers\n2. Open questions  ",
+    }
+
+    with patch(
+        "onyx.connectors.google_calendar.connector.parse_html_page_basic"
+    ) as mock_parse_html:
+        doc = connector._event_to_document(event, "primary")
+
+    mock_parse_html.assert_not_called()
+    assert doc is not None
+    assert isinstance(doc.sections[0], TextSection)
+    # Same flattening parse_html_page_basic applies to plain text
+    assert doc.sections[0].text.endswith(
+        "Description:\nAgenda: 1. Launch blockers 2. Open questions"
+    )
+
+
 def test_should_skip_declined_or_cancelled_events() -> None:
     connector = GoogleCalendarConnector(include_declined_events=False)
 
@@ -68,6 +96,41 @@ def test_should_skip_declined_or_cancelled_events() -> None:
     assert not connector._should_skip_event(confirmed_event)
 
 
+def test_ensure_calendar_names_batches_lookups() -> None:
+    connector = GoogleCalendarConnector()
+    connector._calendar_names = {"primary": "Primary Calendar"}
+
+    batched_request_ids: list[list[str]] = []
+
+    class FakeBatch:
+        def __init__(self, callback: Callable[..., None]) -> None:
+            self.callback = callback
+            self.request_ids: list[str] = []
+            batched_request_ids.append(self.request_ids)
+
+        def add(self, request: Any, request_id: str) -> None:  # noqa: ARG002
+            self.request_ids.append(request_id)
+
+        def execute(self) -> None:
+            self.callback("team@example.com", {"summary": " Team "}, None)
+            self.callback("missing@example.com", None, Exception("not found"))
+
+    calendar_service = MagicMock()
+    calendar_service.new_batch_http_request.side_effect = FakeBatch
+    connector._calendar_service = calendar_service
+
+    connector._ensure_calendar_names(
+        ["primary", "team@example.com", "missing@example.com"]
+    )
+
+    assert batched_request_ids == [["team@example.com", "missing@example.com"]]
+    assert connector._calendar_names == {
+        "primary": "Primary Calendar",
+        "team@example.com": "Team",
+        "missing@example.com": "missing@example.com",
+    }
+
+
 def test_checkpoint_progression() -> None:
     connector = GoogleCalendarConnector()
 
@@ -133,3 +196,67 @@ def test_checkpoint_progression() -> None:
     final_checkpoint = outputs[-1].next_checkpoint
     assert final_checkpoint.has_more is False
     assert final_checkpoint.calendar_cursor == 2
+
+
+def test_retrieve_all_slim_docs_pages_every_calendar() -> None:
+    connector = GoogleCalendarConnector()
+
+    pages: dict[tuple[str, str | None], tuple[list[dict], str | None]] = {
+        ("team", None): ([{"id": "t1"}, {"status": "confirmed"}], "token-team"),
+        ("team", "token-team"): ([{"id": "t2", "status": "cancelled"}], None),
+        ("primary", None): ([{"id": "p1"}], None),
+    }
+
+    def fake_fetch(
+        calendar_id: str,
+        start: float,
+        page_token: str | None,
+        calendar_service: Any,
+        fields: str,
+        now: datetime,
+    ) -> tuple[list[dict], str | None]:
+        assert start == 0
+        assert calendar_service is not None
+        assert fields == SLIM_EVENT_LIST_FIELDS
+        seen_nows.add(now)
+        return pages[(calendar_id, page_token)]
+
+    seen_nows: set[datetime] = set()
+    with (
+        patch.object(
+            connector, "_resolve_calendar_ids", return_value=["team", "primary"]
+        ),
+        patch.object(connector, "_build_calendar_service", return_value=MagicMock()),
+        patch.object(connector, "_fetch_calendar_events_page", side_effect=fake_fetch),
+    ):
+        batches = list(connector.retrieve_all_slim_docs())
+
+    slim_doc_ids = [
+        doc.id for batch in batches for doc in batch if isinstance(doc, SlimDocument)
+    ]
+    assert sorted(slim_doc_ids) == [
+        "google_calendar:primary:p1",
+        "google_calendar:team:t1",
+    ]
+    # all pages share one horizon
+    assert len(seen_nows) == 1
+
+
+def test_event_list_fields_follow_connector_flags() -> None:
+    full_fields = GoogleCalendarConnector()._event_list_fields
+    assert "description" in full_fields
+    assert "attendees(" in full_fields
+
+    minimal_fields = GoogleCalendarConnector(
+        include_event_descriptions=False,
+        include_attendees=False,
+    )._event_list_fields
+    assert "description" not in minimal_fields
+    assert "attendees(" not in minimal_fields
+
+    # declined-event filtering still reads the attendee list
+    declined_filter_fields = GoogleCalendarConnector(
+        include_attendees=False,
+        include_declined_events=False,
+    )._event_list_fields
+    assert "attendees(" in declined_filter_fields
@@ -159,3 +159,34 @@ def test_load_envelope_keyring_uses_mapping_proxy(
     assert isinstance(keyring.key_by_version, MappingProxyType)
     with pytest.raises(TypeError):
         keyring.key_by_version[3] = os.urandom(32)
+
+
+@pytest.mark.parametrize(
+    "secret,expected_key_length",
+    [
+        ("k" * 20, 16),
+        ("k" * 22, 16),
+        ("k" * 28, 24),
+        ("k" * 30, 24),
+        ("k" * 40, 32),
+    ],
+)
+def test_legacy_aes_cbc_trims_secret_to_longest_fitting_key(
+    monkeypatch: pytest.MonkeyPatch,
+    secret: str,
+    expected_key_length: int,
+) -> None:
+    from cryptography.hazmat.primitives import padding
+    from cryptography.hazmat.primitives.ciphers import algorithms
+    from cryptography.hazmat.primitives.ciphers import Cipher
+    from cryptography.hazmat.primitives.ciphers import modes
+
+    monkeypatch.setattr(encryption, "ENCRYPTION_KEY_SECRET", secret)
+    key = secret.encode()[:expected_key_length]
+    iv = os.urandom(16)
+    padder = padding.PKCS7(algorithms.AES.block_size).padder()
+    padded = padder.update(b"legacy-token") + padder.finalize()
+    encryptor = Cipher(algorithms.AES(key), modes.CBC(iv)).encryptor()
+    payload = iv + encryptor.update(padded) + encryptor.finalize()
+
+    assert encryption._decrypt_legacy_aes_cbc(payload) == "legacy-token"
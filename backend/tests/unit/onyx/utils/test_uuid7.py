@@ -0,0 +1,31 @@
+import time
+import uuid
+
+from onyx.utils.uuid7 import uuid7
+
+
+def test_uuid7_sets_version_and_variant() -> None:
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_embeds_current_millisecond_timestamp() -> None:
+    before_ms = time.time_ns() // 1_000_000
+    value = uuid7()
+    after_ms = time.time_ns() // 1_000_000
+
+    assert before_ms <= value.int >> 80 <= after_ms
+
+
+def test_uuid7_sorts_by_creation_time() -> None:
+    earlier = uuid7()
+    time.sleep(0.002)
+    later = uuid7()
+
+    assert earlier < later
+
+
+def test_uuid7_is_unique_within_a_millisecond() -> None:
+    values = {uuid7() for _ in range(1000)}
+    assert len(values) == 1000